@@ -17,14 +17,8 @@ document.addEventListener('DOMContentLoaded', function() {
     let currentPage = parseInt(urlParams.get('page')) || 1;
     let currentCategory = urlParams.get('category') || null;
     
-    // Fetch blog posts from the index.json file
-    fetch('blog-posts/index.json')
-        .then(response => {
-            if (!response.ok) {
-                throw new Error('Network response was not ok');
-            }
-            return response.json();
-        })
+    // Fetch blog posts from the index file
+    fetchPostIndex()
         .then(posts => {
             // Sort posts by date (newest first)
             posts = sortPostsByDate(posts);
@@ -49,6 +43,34 @@ document.addEventListener('DOMContentLoaded', function() {
             }
         });
     
+    /**
+     * Fetch the post index, preferring the gzip-compressed copy when the
+     * browser can decompress it and falling back to the plain index.json
+     */
+    function fetchPostIndex() {
+        const fetchOk = url => fetch(url).then(response => {
+            if (!response.ok) {
+                throw new Error('Network response was not ok');
+            }
+            return response;
+        });
+        
+        if (!('DecompressionStream' in window)) {
+            return fetchOk('blog-posts/index.json').then(response => response.json());
+        }
+        
+        return fetchOk('blog-posts/index.json.gz')
+            .then(response => {
+                // The browser already decoded it if the server sent Content-Encoding: gzip
+                if (response.headers.get('Content-Encoding') === 'gzip') {
+                    return response.json();
+                }
+                const stream = response.body.pipeThrough(new DecompressionStream('gzip'));
+                return new Response(stream).json();
+            })
+            .catch(() => fetchOk('blog-posts/index.json').then(response => response.json()));
+    }
+    
     /**
      * Sort posts by date (newest first)
      */
@@ -10,20 +10,54 @@ This script:
 """
 
 import os
+import gzip
+import hashlib
+import heapq
+import asyncio
 import json
 import time
 import random
+import atexit
 import ftplib
 import requests
-import html2text
 import re
-import paramiko
+import posixpath
 from pathlib import Path
-from datetime import datetime
-from bs4 import BeautifulSoup
-from openai import OpenAI
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from datetime import datetime, timezone
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+from openai import AsyncOpenAI
 from PIL import Image
 from io import BytesIO
+from string import Template
+from types import MappingProxyType
+from urllib.parse import quote
+
+# Prefer the C-based lxml parser for scraping, falling back to the built-in one
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# Prefer orjson for reading and writing the post and index files, falling back to json
+try:
+    import orjson
+
+    def dump_json_bytes(data, compact=False):
+        return orjson.dumps(data) if compact else orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    load_json_bytes = orjson.loads
+except ImportError:
+    def dump_json_bytes(data, compact=False):
+        if compact:
+            return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+    load_json_bytes = json.loads
 
 # Configuration - these will come from GitHub Secrets in production
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY", "your-api-key-here")
@@ -32,6 +66,10 @@ FTP_USER = os.environ.get("FTP_USER", "your-username")
 FTP_PASS = os.environ.get("FTP_PASS", "your-password")
 FTP_BLOG_DIR = "/blog-posts/" # Directory relative to web root
 FTP_IS_SFTP = os.environ.get("FTP_IS_SFTP", "false").lower() == "true"  # Set to true for SFTP instead of FTP
+FTP_USE_TLS = (os.environ.get("FTP_USE_TLS") or "true").lower() == "true"  # Use FTPS (FTP over TLS) for FTP uploads; an unset secret arrives empty
+FTP_UPLOAD_WORKERS = max(1, int(os.environ.get("FTP_UPLOAD_WORKERS", "4")))  # Parallel FTP connections (or SFTP channels) used for uploads
+FTP_BLOCKSIZE = 65536  # Bytes sent per socket write during STOR
+FTP_SMALL_FILE_SIZE = 4096  # Files below this size are read into memory before upload
 
 # Local blog post storage
 LOCAL_BLOG_DIR = Path("blog-posts")
@@ -41,13 +79,107 @@ LOCAL_BLOG_DIR.mkdir(exist_ok=True)
 IMAGES_DIR = LOCAL_BLOG_DIR / "images"
 IMAGES_DIR.mkdir(exist_ok=True)
 
+# Marker file whose mtime records the last successful upload
+LAST_UPLOAD_STATE = LOCAL_BLOG_DIR / ".last_upload"
+
+# Set to true while developing to keep completed chat responses here, keyed by a hash
+# of the request, so an identical request is answered without calling the API. Off by
+# default, since a production re-run would otherwise republish the same article
+COMPLETION_CACHE_DIR = Path(".cache") / "completions"
+USE_COMPLETION_CACHE = os.environ.get("USE_COMPLETION_CACHE", "false").lower() == "true"
+
+# IDs of posts saved by this run but not yet in the index; a run that stops early
+# leaves them here so the next run indexes them instead of generating them again
+PENDING_POSTS_FILE = Path(".cache") / "pending_posts.txt"
+
+# Trending topics are reused for this many seconds before being fetched again (0 disables)
+TOPICS_CACHE_FILE = Path(".cache") / "topics.json"
+TOPICS_CACHE_TTL = int(os.environ.get("TOPICS_CACHE_TTL", "3600"))
+
 # Number of blog posts to generate
 POSTS_TO_GENERATE = 1
+MAX_CONCURRENT_POSTS = 10  # Posts generated at the same time to stay under the API rate limits
+MAX_CONCURRENT_IMAGES = 4  # DALL-E requests at the same time, since image rate limits are much lower
+
+# Set to true to generate post text through the discounted OpenAI Batch API (results can take up to 24h)
+BATCH_MODE = os.environ.get("BATCH_MODE", "false").lower() == "true"
+BATCH_POLL_INTERVAL = 60  # Seconds between batch status checks
+
+# Retries for failed OpenAI requests (the client's default is 2)
+OPENAI_MAX_RETRIES = 5
 
 # Model selection
-GPT_MODEL = "gpt-3.5-turbo"  # More cost-effective for regular content generation
+GPT_MODEL = "gpt-4o-mini"  # Cost-effective for regular content generation and supports structured outputs
 BROWSING_MODEL = "gpt-4-1106-preview"  # Model that supports tools/browsing for research
 
+# JSON schemas for topics so the model always returns parseable output
+TOPIC_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "title": {"type": "string"},
+        "summary": {"type": "string"},
+        "relevance": {"type": "string"}
+    },
+    "required": ["title", "summary", "relevance"],
+    "additionalProperties": False
+}
+TOPICS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "topics": {"type": "array", "items": TOPIC_SCHEMA}
+    },
+    "required": ["topics"],
+    "additionalProperties": False
+}
+
+# JSON schema for a blog post: meta description, keywords and HTML content from one request
+POST_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "meta_description": {"type": "string"},
+        "keywords": {"type": "string"},
+        "content": {"type": "string"}
+    },
+    "required": ["meta_description", "keywords", "content"],
+    "additionalProperties": False
+}
+POST_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "blog_post", "schema": POST_SCHEMA, "strict": True}
+}
+
+# Fixed instructions for every blog post request, sent as the system message
+# ahead of the per-topic details so only the short user message varies
+POST_SYSTEM_PROMPT = """
+    You write comprehensive, detailed, and informative blog posts for the Pro Truck Logistics company blog.
+    
+    Posts are targeted at semi-truck fleet operators, commercial truck drivers, and logistics managers in the trucking industry.
+    
+    Follow this structure:
+    1. An engaging introduction explaining why this topic matters specifically to semi-truck operators and fleet managers
+    2. 2-3 main sections with descriptive headings (using H2 tags) covering different aspects of the topic as it relates to commercial trucking
+    3. Include subsections with H3 tags where appropriate
+    4. For each section, include practical insights, data points (you can create realistic fictional data), and actionable advice for trucking companies
+    5. Use bullet points or numbered lists where appropriate to break up text
+    6. Include a relevant quote from a trucking industry expert (fictional is fine)
+    7. A conclusion summarizing key takeaways and offering forward-looking perspective for semi-truck fleet operators
+    
+    Make sure to:
+    - Be detailed and specific, aiming for around 1500-2000 words
+    - Use trucking industry-specific terminology appropriately (semi, rig, haul, fleet, etc.)
+    - Mention semi-trucks, commercial trucking, or freight hauling frequently
+    - Optimize the post for the SEO keywords you choose
+    - Create content that would be valuable for semi-truck logistics professionals in 2025
+    - Include practical, actionable information that truck fleet managers can apply
+    - Format the content in HTML using appropriate tags (<p>, <h2>, <h3>, <ul>, <li>, <blockquote>, etc.)
+    - Make all content factually accurate and avoid making specific claims about real companies without verification
+    
+    Respond with a JSON object with exactly these fields:
+    - "meta_description": an SEO-optimized meta description under 160 characters that includes commercial trucking keywords, mentions semi-trucks, fleet management, or freight hauling, and appeals to truck fleet operators and logistics managers
+    - "keywords": 5-7 SEO keywords or phrases specifically related to commercial trucking, semi-trucks, and freight hauling, as a single comma-separated string
+    - "content": the full blog post in HTML
+    """
+
 # Blog post categories - expanded with more specific industry categories
 BLOG_CATEGORIES = [
     # Industry Overview
@@ -100,6 +232,70 @@ BLOG_CATEGORIES = [
     "Expert Interviews", "Industry Awards", "Case Studies"
 ]
 
+# Keywords used to pick a category when a topic doesn't come with one
+CATEGORY_KEYWORDS = {
+    "Industry Trends": ["trend", "industry", "market", "outlook", "future"],
+    "Market Analysis": ["market", "analysis", "data", "statistics", "report"],
+    "Economic Outlook": ["economic", "economy", "forecast", "financial", "cost"],
+    "Supply Chain Management": ["supply chain", "inventory", "procurement", "sourcing"],
+    "Driver Recruitment": ["recruit", "hiring", "driver shortage", "talent", "workforce"],
+    "Driver Retention": ["retention", "turnover", "driver satisfaction", "career"],
+    "Sustainability": ["sustainable", "green", "environment", "emission", "carbon"],
+    "Technology Trends": ["technology", "tech", "innovation", "digital", "software"],
+    "Safety": ["safety", "accident", "prevention", "risk", "secure"],
+    "Regulations": ["regulation", "compliance", "law", "legal", "requirement"],
+    "Fleet Management": ["fleet", "management", "maintenance", "vehicle", "asset"],
+    "Fuel Management": ["fuel", "diesel", "gas", "consumption", "efficiency"]
+}
+
+def _build_keyword_categories():
+    """
+    Maps each keyword to the categories that list it ("market" scores for two).
+    """
+    keyword_categories = {}
+    for category, keywords in CATEGORY_KEYWORDS.items():
+        for keyword in keywords:
+            keyword_categories[keyword] = keyword_categories.get(keyword, ()) + (category,)
+    return keyword_categories
+
+# Read-only keyword -> categories map
+KEYWORD_CATEGORIES = MappingProxyType(_build_keyword_categories())
+
+# Keywords that start with each keyword, itself included. The pattern below only
+# reports the longest keyword starting at a position, so the shorter ones that start
+# there too ("tech" inside "technology") are looked up here
+KEYWORD_PREFIXES = MappingProxyType({
+    keyword: tuple(other for other in KEYWORD_CATEGORIES if keyword.startswith(other))
+    for keyword in KEYWORD_CATEGORIES
+})
+
+# All keywords in one lookahead alternation, longest first, so a topic is scanned once
+# instead of per keyword and keywords overlapping each other are all found
+CATEGORY_KEYWORD_PATTERN = re.compile(
+    "(?=(" + "|".join(re.escape(k) for k in sorted(KEYWORD_CATEGORIES, key=len, reverse=True)) + "))"
+)
+
+# Terms that mark a scraped or suggested topic as being about commercial trucking
+TRUCKING_TERMS_PATTERN = re.compile("truck|fleet|haul|freight|driver|diesel|semi|transport")
+
+# First paragraph of a post's HTML, used for the listing excerpt
+FIRST_PARAGRAPH_PATTERN = re.compile(r"<p[\s>].*?</p>", re.DOTALL | re.IGNORECASE)
+
+# Post images are stored as WebP no larger than this, far smaller than DALL-E's PNGs
+IMAGE_MAX_EDGE = 1024
+IMAGE_WEBP_QUALITY = 82
+
+# Image used for a post when its generated image can't be downloaded
+FALLBACK_IMAGE_URL = "https://i.imgur.com/tRwURlo.jpeg"
+
+# Share button links for each post, filled with the post URL and URL-encoded title
+SHARE_LINKS = {
+    "facebook": "https://www.facebook.com/sharer/sharer.php?u={url}",
+    "twitter": "https://twitter.com/intent/tweet?url={url}&text={title}",
+    "linkedin": "https://www.linkedin.com/shareArticle?mini=true&url={url}&title={title}",
+    "email": "mailto:?subject={title}&body=Check out this article: {url}"
+}
+
 # Blog authors
 AUTHORS = [
     {
@@ -122,10 +318,65 @@ AUTHORS = [
     }
 ]
 
-# Initialize OpenAI client
-client = OpenAI(api_key=OPENAI_API_KEY)
+# Initialize the OpenAI client - async so independent calls can run concurrently.
+# Rate limits, timeouts, connection errors and 5xx responses are retried by the
+# client itself with exponential backoff before any fallback kicks in.
+async_client = AsyncOpenAI(api_key=OPENAI_API_KEY, max_retries=OPENAI_MAX_RETRIES)
+
+# Shared HTTP session so repeated requests reuse pooled connections
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": "Mozilla/5.0 (compatible; ProTruckLogisticsBlogBot/1.0)"})
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=Retry(total=2, backoff_factor=0.3)))
+
+# Limits image generation separately from posts, in real-time and batch mode alike
+_image_semaphore = asyncio.Semaphore(MAX_CONCURRENT_IMAGES)
 
-def get_current_logistics_topics():
+async def generate_category_topic(category):
+    """
+    Generates a single blog topic for the given category.
+    Returns None if the request or the JSON parsing fails.
+    """
+    try:
+        # Generate a topic based on the category
+        prompt = f"""
+        Generate a blog post topic for a semi-truck logistics company in the category: "{category}".
+        
+        The topic should be:
+        1. Specifically about commercial trucking, semi-trucks, or freight hauling
+        2. Relevant to fleet managers and truck operators
+        3. Timely and interesting for 2025
+        
+        Return a JSON object with:
+        - "title": A catchy headline that mentions trucks, fleets, or freight
+        - "summary": A brief 1-2 sentence description of the topic
+        - "relevance": Why this matters to semi-truck logistics professionals
+        
+        Make sure the topic is specifically about semi-trucks and commercial trucking, not general logistics.
+        """
+        
+        # Structured outputs guarantee the response matches TOPIC_SCHEMA
+        response = await async_client.chat.completions.create(
+            model=GPT_MODEL,
+            messages=[{"role": "user", "content": prompt}],
+            response_format={
+                "type": "json_schema",
+                "json_schema": {"name": "topic", "schema": TOPIC_SCHEMA, "strict": True}
+            }
+        )
+        
+        topic = json.loads(response.choices[0].message.content)
+        
+        # Add the category to the topic
+        topic["category"] = category
+        
+        print(f"Generated topic for category: {category}")
+        return topic
+    
+    except Exception as e:
+        print(f"Error generating topic for category {category}: {e}")
+        return None
+
+async def get_current_logistics_topics():
     """
     Fetches current trending topics in logistics using GPT with web search capabilities.
     Falls back to category-based topic generation if web search fails.
@@ -133,6 +384,11 @@ def get_current_logistics_topics():
     """
     method_used = "Unknown"
     
+    # Read the clock once for every prompt and fallback string built below
+    now = datetime.now()
+    current_date = now.strftime("%B %d, %Y")
+    current_year = now.year
+    
     # First try: Use GPT with tool use capability and more specific trucking focus
     try:
         print("Attempting to get current logistics news via GPT with browsing capability...")
@@ -159,7 +415,7 @@ def get_current_logistics_topics():
         ]
         
         # First message to call the search function with more specific semi-truck focus
-        first_response = client.chat.completions.create(
+        first_response = await async_client.chat.completions.create(
             model=BROWSING_MODEL,  # Use a model that supports function calling
             messages=[{"role": "user", "content": "What are the latest news and trending topics in the semi-truck transportation and logistics industry from the past week? Focus specifically on commercial trucking, freight hauling, and long-haul transportation."}],
             tools=tools,
@@ -186,7 +442,7 @@ def get_current_logistics_topics():
             ]
             
             # Second call to process the "search results" with more specific instructions
-            second_response = client.chat.completions.create(
+            second_response = await async_client.chat.completions.create(
                 model=BROWSING_MODEL,
                 messages=[
                     {"role": "user", "content": "What are the latest news and trending topics in the semi-truck transportation and logistics industry from the past week? Focus specifically on commercial trucking, freight hauling, and long-haul transportation."},
@@ -208,35 +464,24 @@ def get_current_logistics_topics():
                         
                         Make sure topics are specifically relevant to a semi-truck logistics company, not general logistics.
                         
-                        Format your response as JSON with an array of objects containing "title", "summary", and "relevance" keys."""
+                        Format your response as a JSON object with a "topics" array of objects containing "title", "summary", and "relevance" keys."""
                     }
-                ]
+                ],
+                # JSON mode guarantees a parseable object (this model predates structured outputs)
+                response_format={"type": "json_object"}
             )
             
             content = second_response.choices[0].message.content
             
-            # Try to extract JSON from the response
             try:
-                # Check for JSON code blocks
-                json_match = re.search(r'```json\s*([\s\S]*?)\s*```', content)
-                if json_match:
-                    json_str = json_match.group(1)
-                else:
-                    # Look for array pattern
-                    json_match = re.search(r'(\[\s*\{.*\}\s*\])', content, re.DOTALL)
-                    if json_match:
-                        json_str = json_match.group(1)
-                    else:
-                        json_str = content
-                
-                topics = json.loads(json_str)
+                topics = json.loads(content)["topics"]
                 
                 # Validate that topics are actually about semi-trucks/commercial trucking
                 valid_topics = []
                 for topic in topics:
                     title = topic.get('title', '').lower()
                     summary = topic.get('summary', '').lower()
-                    if any(term in title or term in summary for term in ['truck', 'fleet', 'haul', 'freight', 'driver', 'diesel', 'semi', 'transport']):
+                    if TRUCKING_TERMS_PATTERN.search(title) or TRUCKING_TERMS_PATTERN.search(summary):
                         valid_topics.append(topic)
                 
                 if len(valid_topics) >= 3:
@@ -245,7 +490,7 @@ def get_current_logistics_topics():
                     return valid_topics
                 else:
                     print("Retrieved topics weren't specifically about semi-trucks, trying another method")
-            except json.JSONDecodeError as e:
+            except (json.JSONDecodeError, KeyError) as e:
                 print(f"Failed to parse JSON from GPT response: {e}")
                 # Continue to second try below
         else:
@@ -258,8 +503,6 @@ def get_current_logistics_topics():
     try:
         print("Attempting to generate realistic trending topics with GPT...")
         
-        current_date = datetime.now().strftime("%B %d, %Y")
-        
         prompt = f"""
         Today is {current_date}. Based on current industry trends and economic conditions, 
         what are 5 realistic trending topics in the semi-truck transportation and logistics industry that would 
@@ -280,35 +523,23 @@ def get_current_logistics_topics():
         - Semi-truck maintenance and fleet management innovations
         - Safety technologies for commercial trucks
 
-        Format your response as a JSON array with objects containing "title", "summary", and "relevance" keys.
+        Return the topics in the "topics" array, each with "title", "summary", and "relevance".
         """
         
-        response = client.chat.completions.create(
+        # Structured outputs guarantee the response matches TOPICS_SCHEMA
+        response = await async_client.chat.completions.create(
             model=GPT_MODEL,
-            messages=[{"role": "user", "content": prompt}]
+            messages=[{"role": "user", "content": prompt}],
+            response_format={
+                "type": "json_schema",
+                "json_schema": {"name": "topics", "schema": TOPICS_SCHEMA, "strict": True}
+            }
         )
         
-        content = response.choices[0].message.content
-        
-        # Try to extract JSON
-        json_match = re.search(r'```json\s*([\s\S]*?)\s*```', content)
-        if json_match:
-            json_str = json_match.group(1)
-        else:
-            json_match = re.search(r'(\[\s*\{.*\}\s*\])', content, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(1)
-            else:
-                json_str = content
-        
-        try:
-            topics = json.loads(json_str)
-            print(f"Successfully generated {len(topics)} trending topics via GPT")
-            method_used = "GPT Generated Trends"
-            return topics
-        except:
-            print("Failed to parse JSON from GPT trend generation")
-            # Continue to fallback below
+        topics = json.loads(response.choices[0].message.content)["topics"]
+        print(f"Successfully generated {len(topics)} trending topics via GPT")
+        method_used = "GPT Generated Trends"
+        return topics
     except Exception as e:
         print(f"Error generating trending topics: {e}")
     
@@ -317,19 +548,24 @@ def get_current_logistics_topics():
         print("Attempting to fetch news from trucking websites...")
         news_articles = []
         
+        # Scraped articles carry no relevance text, so every one shares this line
+        relevance = f"This topic is relevant to semi-truck operators and fleet managers because it addresses current industry challenges and opportunities in {current_year}."
+        
         # Try multiple trucking industry websites
+        # Each strainer limits parsing to the article containers the selectors need
         websites = [
-            {"url": "https://www.ttnews.com/articles/logistics", "article_selector": "article", "title_selector": "h2", "summary_selector": "div.field--name-field-deckhead"},
-            {"url": "https://www.ccjdigital.com/", "article_selector": "article", "title_selector": "h2,h3", "summary_selector": "p.entry-summary"},
-            {"url": "https://www.overdriveonline.com/", "article_selector": "article", "title_selector": "h2,h3", "summary_selector": "p"},
-            {"url": "https://www.fleetowner.com/", "article_selector": "div.node--type-article", "title_selector": "h2,h3", "summary_selector": "div.field--name-field-subheadline"}
+            {"url": "https://www.ttnews.com/articles/logistics", "strainer": SoupStrainer("article"), "article_selector": "article", "title_selector": "h2", "summary_selector": "div.field--name-field-deckhead"},
+            {"url": "https://www.ccjdigital.com/", "strainer": SoupStrainer("article"), "article_selector": "article", "title_selector": "h2,h3", "summary_selector": "p.entry-summary"},
+            {"url": "https://www.overdriveonline.com/", "strainer": SoupStrainer("article"), "article_selector": "article", "title_selector": "h2,h3", "summary_selector": "p"},
+            {"url": "https://www.fleetowner.com/", "strainer": SoupStrainer("div", class_=re.compile(r"\bnode--type-article\b")), "article_selector": "div.node--type-article", "title_selector": "h2,h3", "summary_selector": "div.field--name-field-subheadline"}
         ]
         
         for site in websites:
             try:
-                response = requests.get(site["url"], timeout=10)
+                response = SESSION.get(site["url"], timeout=10)
                 if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, 'html.parser')
+                    # Pass bytes so the parser can detect the page encoding itself
+                    soup = BeautifulSoup(response.content, HTML_PARSER, parse_only=site["strainer"])
                     articles = soup.select(site["article_selector"])
                     
                     for article in articles[:3]:  # Get top 3 articles from each site
@@ -339,11 +575,8 @@ def get_current_logistics_topics():
                         summary_element = article.select_one(site["summary_selector"])
                         summary = summary_element.text.strip() if summary_element else ""
                         
-                        # Create relevance if missing
-                        relevance = f"This topic is relevant to semi-truck operators and fleet managers because it addresses current industry challenges and opportunities in {datetime.now().year}."
-                        
                         # Only add if it seems to be about trucking
-                        if any(term in title.lower() or term in summary.lower() for term in ['truck', 'fleet', 'haul', 'freight', 'driver', 'diesel', 'semi', 'transport']):
+                        if TRUCKING_TERMS_PATTERN.search(title.lower()) or TRUCKING_TERMS_PATTERN.search(summary.lower()):
                             news_articles.append({
                                 "title": title, 
                                 "summary": summary, 
@@ -367,55 +600,9 @@ def get_current_logistics_topics():
     # Select random categories to generate topics for
     selected_categories = random.sample(BLOG_CATEGORIES, min(5, len(BLOG_CATEGORIES)))
     
-    category_topics = []
-    for category in selected_categories:
-        try:
-            # Generate a topic based on the category
-            prompt = f"""
-            Generate a blog post topic for a semi-truck logistics company in the category: "{category}".
-            
-            The topic should be:
-            1. Specifically about commercial trucking, semi-trucks, or freight hauling
-            2. Relevant to fleet managers and truck operators
-            3. Timely and interesting for 2025
-            
-            Return a JSON object with:
-            - "title": A catchy headline that mentions trucks, fleets, or freight
-            - "summary": A brief 1-2 sentence description of the topic
-            - "relevance": Why this matters to semi-truck logistics professionals
-            
-            Make sure the topic is specifically about semi-trucks and commercial trucking, not general logistics.
-            """
-            
-            response = client.chat.completions.create(
-                model=GPT_MODEL,
-                messages=[{"role": "user", "content": prompt}]
-            )
-            
-            content = response.choices[0].message.content
-            
-            # Try to extract JSON
-            json_match = re.search(r'```json\s*([\s\S]*?)\s*```', content)
-            if json_match:
-                json_str = json_match.group(1)
-            else:
-                json_match = re.search(r'(\{.*\})', content, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group(1)
-                else:
-                    json_str = content
-            
-            topic = json.loads(json_str)
-            
-            # Add the category to the topic
-            topic["category"] = category
-            
-            category_topics.append(topic)
-            print(f"Generated topic for category: {category}")
-            
-        except Exception as e:
-            print(f"Error generating topic for category {category}: {e}")
-            continue
+    # Each category is an independent request, so ask for all of them at once
+    results = await asyncio.gather(*(generate_category_topic(category) for category in selected_categories))
+    category_topics = [topic for topic in results if topic]
     
     if category_topics:
         return category_topics
@@ -452,7 +639,33 @@ def get_current_logistics_topics():
     
     return fallback_topics
 
-def get_relevant_image(topic):
+async def get_cached_logistics_topics():
+    """
+    Returns the trending topics from the on-disk cache while it is younger than
+    TOPICS_CACHE_TTL, otherwise fetches fresh topics and stores them.
+    """
+    if TOPICS_CACHE_TTL > 0 and TOPICS_CACHE_FILE.exists():
+        age = time.time() - TOPICS_CACHE_FILE.stat().st_mtime
+        if age < TOPICS_CACHE_TTL:
+            try:
+                topics = load_json_bytes(TOPICS_CACHE_FILE.read_bytes())
+                print(f"Using {len(topics)} cached topics ({int(age)}s old)")
+                return topics
+            except ValueError as e:
+                print(f"Ignoring unreadable topics cache: {e}")
+    
+    topics = await get_current_logistics_topics()
+    
+    if TOPICS_CACHE_TTL > 0:
+        # Write to a temporary file first so an interrupted run never leaves a truncated cache
+        TOPICS_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = TOPICS_CACHE_FILE.with_suffix(".tmp")
+        temp_path.write_bytes(dump_json_bytes(topics))
+        os.replace(temp_path, TOPICS_CACHE_FILE)
+    
+    return topics
+
+async def get_relevant_image(topic):
     """
     First generates a custom DALL-E prompt based on the blog post topic,
     then uses that prompt to generate a unique image.
@@ -488,7 +701,7 @@ def get_relevant_image(topic):
     """
     
     # Get the custom prompt from GPT
-    prompt_response = client.chat.completions.create(
+    prompt_response = await async_client.chat.completions.create(
         model=GPT_MODEL,
         messages=[{"role": "user", "content": prompt_creation_prompt}]
     )
@@ -498,7 +711,7 @@ def get_relevant_image(topic):
     
     # Generate image using the custom prompt
     try:
-        response = client.images.generate(
+        response = await async_client.images.generate(
             model="dall-e-3",
             prompt=custom_image_prompt,
             size="1024x1024",
@@ -521,19 +734,23 @@ def download_and_save_image(image_url, post_id):
     """
     
     # Generate a filename based on post ID
-    local_filename = f"{post_id}-image.png"
+    local_filename = f"{post_id}-image.webp"
     local_path = IMAGES_DIR / local_filename
     
     print(f"Downloading image from {image_url} to {local_path}")
     
     try:
         # Download the image
-        response = requests.get(image_url, timeout=30)
+        response = SESSION.get(image_url, timeout=30)
         response.raise_for_status()  # Raise an exception for HTTP errors
         
-        # Save the image
-        img = Image.open(BytesIO(response.content))
-        img.save(local_path)
+        # Shrink the image and store it as WebP, which is a fraction of the PNG's
+        # size at the same visual quality, for both the upload and page loads
+        with Image.open(BytesIO(response.content)) as img:
+            img.thumbnail((IMAGE_MAX_EDGE, IMAGE_MAX_EDGE), Image.LANCZOS)
+            buffer = BytesIO()
+            img.save(buffer, format="WEBP", quality=IMAGE_WEBP_QUALITY)
+        write_local_file(local_path, buffer.getvalue())
         
         print(f"Image saved successfully to {local_path}")
         
@@ -543,156 +760,150 @@ def download_and_save_image(image_url, post_id):
     except Exception as e:
         print(f"Error downloading/saving image: {e}")
         # Return a placeholder image in case of failure
-        return "https://i.imgur.com/tRwURlo.jpeg"
+        return FALLBACK_IMAGE_URL
     
-def generate_blog_post(topic):
+def choose_category(topic):
     """
-    Generate a comprehensive blog post using the topic data.
-    Returns a dictionary with the post details and content.
+    Use the topic's category if available, otherwise select a relevant one
+    by matching keywords in the topic title and summary.
     """
-    print(f"Generating blog post about: {topic['title']}")
-    
-    # Select a random author
-    author = random.choice(AUTHORS)
-    
-    # Use the topic's category if available, otherwise select a relevant one
     if "category" in topic:
-        category = topic["category"]
-    else:
-        # Try to match a relevant category based on the topic
-        topic_text = (topic['title'] + ' ' + topic.get('summary', '')).lower()
-        
-        # Define category keywords for matching
-        category_keywords = {
-            "Industry Trends": ["trend", "industry", "market", "outlook", "future"],
-            "Market Analysis": ["market", "analysis", "data", "statistics", "report"],
-            "Economic Outlook": ["economic", "economy", "forecast", "financial", "cost"],
-            "Supply Chain Management": ["supply chain", "inventory", "procurement", "sourcing"],
-            "Driver Recruitment": ["recruit", "hiring", "driver shortage", "talent", "workforce"],
-            "Driver Retention": ["retention", "turnover", "driver satisfaction", "career"],
-            "Sustainability": ["sustainable", "green", "environment", "emission", "carbon"],
-            "Technology Trends": ["technology", "tech", "innovation", "digital", "software"],
-            "Safety": ["safety", "accident", "prevention", "risk", "secure"],
-            "Regulations": ["regulation", "compliance", "law", "legal", "requirement"],
-            "Fleet Management": ["fleet", "management", "maintenance", "vehicle", "asset"],
-            "Fuel Management": ["fuel", "diesel", "gas", "consumption", "efficiency"]
-        }
-        
-        # Find the best matching category
-        best_match = None
-        best_score = 0
-        
-        for cat, keywords in category_keywords.items():
-            score = sum(topic_text.count(keyword) for keyword in keywords)
-            if score > best_score:
-                best_score = score
-                best_match = cat
-        
-        # If no good match, pick from the most relevant categories for a trucking company
-        if best_match is None or best_score == 0:
-            trucking_focused_categories = [
-                "Fleet Management", "Driver Retention", "Fuel Management", 
-                "Safety", "Regulations", "Technology Trends"
-            ]
-            category = random.choice(trucking_focused_categories)
-        else:
-            category = best_match
-    
-    # Generate a reasonable reading time (1500-2000 words is about 7-10 mins)
-    read_time = random.randint(7, 10)
-    
-    # Current date for the post
-    post_date = datetime.now().strftime("%B %d, %Y")
+        return topic["category"]
+    
+    # Try to match a relevant category based on the topic
+    topic_text = (topic['title'] + ' ' + topic.get('summary', '')).lower()
+    
+    # Score every category in one pass over the text. Each keyword is counted like
+    # str.count would, so a match overlapping that keyword's previous one is skipped
+    scores = dict.fromkeys(CATEGORY_KEYWORDS, 0)
+    match_ends = {}
+    for match in CATEGORY_KEYWORD_PATTERN.finditer(topic_text):
+        start = match.start()
+        for keyword in KEYWORD_PREFIXES[match.group(1)]:
+            if start >= match_ends.get(keyword, 0):
+                match_ends[keyword] = start + len(keyword)
+                for cat in KEYWORD_CATEGORIES[keyword]:
+                    scores[cat] += 1
+    
+    # Find the best matching category
+    best_match = None
+    best_score = 0
+    
+    for cat, score in scores.items():
+        if score > best_score:
+            best_score = score
+            best_match = cat
+    
+    # If no good match, pick from the most relevant categories for a trucking company
+    if best_match is None or best_score == 0:
+        trucking_focused_categories = [
+            "Fleet Management", "Driver Retention", "Fuel Management", 
+            "Safety", "Regulations", "Technology Trends"
+        ]
+        return random.choice(trucking_focused_categories)
     
-    # Generate SEO meta description
-    print("Generating meta description...")
-    meta_description_prompt = f"""
-    Write an SEO-optimized meta description for a blog post about "{topic['title']}" for a semi-truck logistics company.
-    The description should:
-    - Be compelling and include keywords related to commercial trucking
-    - Mention semi-trucks, fleet management, or freight hauling
-    - Be under 160 characters
-    - Appeal to truck fleet operators and logistics managers
+    return best_match
+
+def build_post_messages(topic, category, post_date):
     """
-    
-    meta_description_response = client.chat.completions.create(
-        model=GPT_MODEL,
-        messages=[{"role": "user", "content": meta_description_prompt}]
-    )
-    meta_description = meta_description_response.choices[0].message.content.strip()
-    
-    # Generate SEO keywords
-    print("Generating SEO keywords...")
-    keywords_prompt = f"""
-    Generate 5-7 SEO keywords or phrases for a blog post about "{topic['title']}" for a semi-truck logistics company. 
-    Include keywords specifically related to commercial trucking, semi-trucks, and freight hauling.
-    Format them as a comma-separated list only. No numbering or bullets.
+    Builds the chat messages for a blog post. The fixed writing instructions
+    go first as the system message so every request shares the same prefix,
+    and only the topic details change in the user message.
     """
-    
-    keywords_response = client.chat.completions.create(
-        model=GPT_MODEL,
-        messages=[{"role": "user", "content": keywords_prompt}]
-    )
-    keywords = keywords_response.choices[0].message.content.strip()
-    
-    # Generate blog post content
-    print("Generating main blog content...")
-    content_prompt = f"""
-    Write a comprehensive, detailed, and informative blog post about "{topic['title']}" for Pro Truck Logistics company blog.
+    return [
+        {"role": "system", "content": POST_SYSTEM_PROMPT},
+        {"role": "user", "content": f"""
+    Write the blog post about "{topic['title']}".
     Additional context: {topic.get('summary', '')}
     Relevance to the industry: {topic.get('relevance', '')}
     
-    The post should be targeted at semi-truck fleet operators, commercial truck drivers, and logistics managers in the trucking industry.
-    
     Current date: {post_date}
-    
-    Follow this structure:
-    1. An engaging introduction explaining why this topic matters specifically to semi-truck operators and fleet managers
-    2. 2-3 main sections with descriptive headings (using H2 tags) covering different aspects of the topic as it relates to commercial trucking
-    3. Include subsections with H3 tags where appropriate
-    4. For each section, include practical insights, data points (you can create realistic fictional data), and actionable advice for trucking companies
-    5. Use bullet points or numbered lists where appropriate to break up text
-    6. Include a relevant quote from a trucking industry expert (fictional is fine)
-    7. A conclusion summarizing key takeaways and offering forward-looking perspective for semi-truck fleet operators
-    
-    Make sure to:
-    - Be detailed and specific, aiming for around 1500-2000 words
-    - Use trucking industry-specific terminology appropriately (semi, rig, haul, fleet, etc.)
-    - Mention semi-trucks, commercial trucking, or freight hauling frequently
-    - Optimize for these SEO keywords: {keywords}
-    - Create content that would be valuable for semi-truck logistics professionals in 2025
-    - Include practical, actionable information that truck fleet managers can apply
-    - Format the content in HTML using appropriate tags (<p>, <h2>, <h3>, <ul>, <li>, <blockquote>, etc.)
-    - Make all content factually accurate and avoid making specific claims about real companies without verification
-    
     Category: {category}
+    """}
+    ]
+
+def parse_post_response(text):
     """
-    
-    content_response = client.chat.completions.create(
-        model=GPT_MODEL,
-        messages=[{"role": "user", "content": content_prompt}]
-    )
-    content = content_response.choices[0].message.content.strip()
-    
-    # Get a relevant image
-    dalle_image_url = get_relevant_image(topic)
-    
-    # Create an excerpt for the blog listing
-    h = html2text.HTML2Text()
-    h.ignore_links = True
-    text_content = h.handle(content)
-    first_paragraph = text_content.split('\n\n')[0].replace('\n', ' ').strip()
+    Parses the JSON returned for a post prompt into (meta_description, keywords, content).
+    """
+    data = json.loads(text)
+    return data["meta_description"].strip(), data["keywords"].strip(), data["content"].strip()
+
+def allocate_post_ids(count):
+    """
+    Reserves sequential post IDs after the highest existing post number.
+    IDs are handed out up front so posts generated together never collide,
+    and a gap left by a failed post is never filled by a later run.
+    """
+    existing_numbers = []
+    for path in LOCAL_BLOG_DIR.glob("bp*.json"):
+        try:
+            existing_numbers.append(int(path.stem[2:]))
+        except ValueError:
+            continue
+    next_number = max(existing_numbers, default=0) + 1
+    return [f"bp{next_number + i}" for i in range(count)]
+
+def make_excerpt(content):
+    """
+    Returns the first paragraph of the post's HTML as plain text, cut to 200 characters.
+    """
+    # Only the first <p> is needed, so parse just that fragment
+    # (or the whole post if it has no paragraphs at all)
+    first_p = FIRST_PARAGRAPH_PATTERN.search(content)
+    fragment = first_p.group() if first_p else content
+    first_paragraph = " ".join(BeautifulSoup(fragment, HTML_PARSER).get_text(" ", strip=True).split())
     excerpt = first_paragraph[:200]
     if len(first_paragraph) > 200:
         excerpt += "..."
+    return excerpt
+
+async def generate_post_image(topic):
+    """
+    Generates a relevant image for the topic.
+    Only needs the topic, so it can run while the post text is being written.
+    Returns the temporary DALL-E image URL, or None if generation failed.
+    """
+    try:
+        async with _image_semaphore:
+            return await get_relevant_image(topic)
+    except Exception as e:
+        # The post still goes out, just with the placeholder image
+        print(f"Using the fallback image after image generation failed: {e}")
+        return None
+
+async def save_post_image(image_url, post_id):
+    """
+    Downloads a generated image and saves it locally.
+    Returns the local path to the saved image, or the fallback image URL.
+    """
+    if image_url is None:
+        return FALLBACK_IMAGE_URL
     
-    # Create a simpler post ID based on count of existing posts
-    existing_posts = list(LOCAL_BLOG_DIR.glob("bp*.json"))
-    next_number = len(existing_posts) + 1
-    post_id = f"bp{next_number}"
+    # Download and save the image locally without blocking other posts
+    return await asyncio.to_thread(download_and_save_image, image_url, post_id)
+
+async def fetch_post_image(topic, post_id):
+    """
+    Generates a relevant image for the topic and saves it locally.
+    Returns the local path to the saved image, or the fallback image URL.
+    """
+    return await save_post_image(await generate_post_image(topic), post_id)
+
+async def assemble_post(topic, post_id, category, post_date, meta_description, keywords, content, local_image_path):
+    """
+    Combines the generated text and image with an author and excerpt.
+    Returns a dictionary with the post details and content.
+    """
+    # Select a random author
+    author = random.choice(AUTHORS)
+    
+    # Generate a reasonable reading time (1500-2000 words is about 7-10 mins)
+    read_time = random.randint(7, 10)
     
-    # Download and save the image locally
-    local_image_path = download_and_save_image(dalle_image_url, post_id)
+    # Create an excerpt for the blog listing, parsing off the event loop so
+    # other posts' requests keep flowing
+    excerpt = await asyncio.to_thread(make_excerpt, content)
     
     # Assemble the post data
     post = {
@@ -716,6 +927,164 @@ def generate_blog_post(topic):
     
     return post
 
+async def chat_completion(messages, response_format=None):
+    """
+    Sends a chat completion and returns the stripped response text.
+    Identical requests are served from the on-disk completion cache.
+    """
+    request = {"model": GPT_MODEL, "messages": messages}
+    if response_format:
+        request["response_format"] = response_format
+    
+    cache_path = None
+    if USE_COMPLETION_CACHE:
+        request_key = hashlib.sha256(json.dumps(request, sort_keys=True).encode("utf-8")).hexdigest()
+        cache_path = COMPLETION_CACHE_DIR / f"{request_key}.txt"
+        if cache_path.exists():
+            print("Using cached completion")
+            return cache_path.read_text(encoding="utf-8")
+    
+    response = await async_client.chat.completions.create(**request)
+    choice = response.choices[0]
+    text = choice.message.content.strip()
+    
+    # Only complete answers are cached; a response cut off by the length limit
+    # would otherwise fail to parse on every re-run without reaching the API again
+    if cache_path and choice.finish_reason == "stop":
+        # Write to a temporary file first so an interrupted run never leaves a truncated entry
+        COMPLETION_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        temp_path = cache_path.with_suffix(".tmp")
+        temp_path.write_text(text, encoding="utf-8")
+        os.replace(temp_path, cache_path)
+    
+    return text
+
+async def generate_blog_post(topic, post_id):
+    """
+    Generate a comprehensive blog post using the topic data.
+    Returns a dictionary with the post details and content.
+    """
+    print(f"Generating blog post about: {topic['title']}")
+    
+    category = choose_category(topic)
+    
+    # Current date for the post
+    post_date = datetime.now().strftime("%B %d, %Y")
+    
+    # Meta description, keywords and content all come back from one request,
+    # and the image doesn't depend on them, so it is generated at the same time
+    print("Generating meta description, SEO keywords, main blog content and image...")
+    image_task = asyncio.create_task(generate_post_image(topic))
+    try:
+        response_text = await chat_completion(build_post_messages(topic, category, post_date), POST_RESPONSE_FORMAT)
+        meta_description, keywords, content = parse_post_response(response_text)
+    except BaseException:
+        # The post won't be published, so stop generating an image for it
+        image_task.cancel()
+        raise
+    
+    # Only save the image once the post text is known to be usable
+    local_image_path = await save_post_image(await image_task, post_id)
+    
+    return await assemble_post(topic, post_id, category, post_date, meta_description, keywords, content, local_image_path)
+
+async def run_chat_batch(requests_by_id, response_format=None):
+    """
+    Runs a set of chat completions through the OpenAI Batch API.
+    Takes a dictionary of custom_id -> messages and blocks until the batch
+    finishes, returning a dictionary of custom_id -> response text.
+    """
+    # The Batch API rejects an empty input file
+    if not requests_by_id:
+        return {}
+    
+    # One JSONL line per request, tagged so results can be mapped back
+    lines = []
+    for custom_id, messages in requests_by_id.items():
+        body = {"model": GPT_MODEL, "messages": messages}
+        if response_format:
+            body["response_format"] = response_format
+        lines.append(json.dumps({
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": body
+        }))
+    batch_input = ("\n".join(lines) + "\n").encode("utf-8")
+    
+    batch_file = await async_client.files.create(file=("batch.jsonl", batch_input), purpose="batch")
+    job = await async_client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h"
+    )
+    print(f"Submitted batch {job.id} with {len(requests_by_id)} requests")
+    
+    # Poll until the batch reaches a terminal state
+    while job.status not in ("completed", "failed", "expired", "cancelled"):
+        await asyncio.sleep(BATCH_POLL_INTERVAL)
+        job = await async_client.batches.retrieve(job.id)
+        print(f"Batch {job.id} status: {job.status}")
+    
+    if job.status != "completed" or not job.output_file_id:
+        raise RuntimeError(f"Batch {job.id} ended with status {job.status}")
+    
+    results = {}
+    output = (await async_client.files.content(job.output_file_id)).text
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        result = json.loads(line)
+        response = result.get("response") or {}
+        if response.get("status_code") != 200:
+            print(f"Batch request {result['custom_id']} failed: {result.get('error')}")
+            continue
+        results[result["custom_id"]] = response["body"]["choices"][0]["message"]["content"].strip()
+    
+    # Requests without a result are left out rather than failing the whole batch
+    missing = set(requests_by_id) - set(results)
+    if missing:
+        print(f"Batch {job.id} is missing results for: {', '.join(sorted(missing))}")
+    
+    return results
+
+async def generate_blog_posts_batch(topics, post_ids):
+    """
+    Generates blog posts for several topics through the OpenAI Batch API,
+    which costs half as much as real-time completions.
+    """
+    post_date = datetime.now().strftime("%B %d, %Y")
+    categories = [choose_category(topic) for topic in topics]
+    
+    print("Generating blog posts via Batch API...")
+    post_requests = {
+        f"post-{i}": build_post_messages(topic, categories[i], post_date)
+        for i, topic in enumerate(topics)
+    }
+    # Images are generated and saved while the batch runs, since DALL-E
+    # URLs expire long before a slow batch would finish
+    results, image_paths = await asyncio.gather(
+        run_chat_batch(post_requests, POST_RESPONSE_FORMAT),
+        asyncio.gather(*(fetch_post_image(topic, post_ids[i]) for i, topic in enumerate(topics)))
+    )
+    
+    # A post whose result is missing or unreadable is skipped so the rest of
+    # the batch is still published, as in the real-time path
+    assembled = []
+    for i, topic in enumerate(topics):
+        response_text = results.get(f"post-{i}")
+        if response_text is None:
+            continue
+        try:
+            meta_description, keywords, content = parse_post_response(response_text)
+        except (ValueError, KeyError) as e:
+            print(f"Error generating blog post about {topic['title']}: {e}")
+            continue
+        assembled.append(assemble_post(topic, post_ids[i], categories[i], post_date, meta_description, keywords, content, image_paths[i]))
+    
+    # Excerpts for every post are produced concurrently
+    return await asyncio.gather(*assembled)
+
 def add_heading_ids_and_toc(html_content):
     """
     Adds IDs to H2 and H3 headings and generates a table of contents.
@@ -748,6 +1117,21 @@ def add_heading_ids_and_toc(html_content):
     # Return the modified HTML content and TOC HTML
     return str(soup), toc_html
 
+# Bytes of every file written during this run, so uploads can send them from
+# memory instead of reading them back from disk
+_written_files = {}
+
+def write_local_file(path, data):
+    """
+    Writes bytes to a local blog file and keeps a copy for the upload.
+    The bytes go to a hidden temporary file that is then moved into place,
+    so an interrupted run never leaves a truncated file to be uploaded later.
+    """
+    temp_path = path.with_name(f".{path.name}.tmp")
+    temp_path.write_bytes(data)
+    os.replace(temp_path, path)
+    _written_files[path] = data
+
 def save_blog_post(post):
     """
     Save the blog post as a JSON file locally.
@@ -756,12 +1140,19 @@ def save_blog_post(post):
     filename = f"{post_id}.json"
     filepath = LOCAL_BLOG_DIR / filename
     
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(post, f, ensure_ascii=False, indent=2)
+    write_local_file(filepath, dump_json_bytes(post))
     
     print(f"Saved blog post to {filepath}")
     return filepath
 
+@lru_cache(maxsize=1)
+def _load_template():
+    """
+    Reads the blog post template once per run; every post renders from the same copy.
+    """
+    with open("blog-post-template.html", "r", encoding="utf-8") as f:
+        return Template(f.read())
+
 def create_blog_post_html(post):
     """
     Creates an HTML file for a blog post based on the template.
@@ -769,53 +1160,7 @@ def create_blog_post_html(post):
     post_id = post["id"]
     html_filename = f"post-{post_id}.html"
     
-    # Read the blog post template
-    with open("blog-post-template.html", "r", encoding="utf-8") as f:
-        template = f.read()
-    
-    # Function to format date to ISO 8601 with timezone
-    def format_iso_date(date_string):
-        """Convert a date string like 'March 29, 2025' to ISO 8601 format with timezone."""
-        try:
-            import datetime
-            # Parse the date string
-            date_obj = datetime.datetime.strptime(date_string, "%B %d, %Y")
-            # Format to ISO 8601 with timezone
-            return date_obj.strftime("%Y-%m-%dT00:00:00Z")
-        except Exception as e:
-            print(f"Date parsing error: {e}")
-            # If parsing fails, return original string
-            return date_string
-    
-    # Create Schema.org Article JSON data
-    schema_data = {
-        "@context": "https://schema.org",
-        "@type": "BlogPosting",
-        "headline": post["title"],
-        "description": post["meta"]["description"],
-        "image": f"https://www.protrucklogistics.com/{post['image']}",
-        "author": {
-            "@type": "Person",
-            "name": post["author"],
-            "url": f"https://www.protrucklogistics.com/about.html#{post['author'].lower().replace(' ', '-')}"
-        },
-        "publisher": {
-            "@type": "Organization",
-            "name": "Pro Truck Logistics",
-            "logo": {
-                "@type": "ImageObject",
-                "url": "https://www.protrucklogistics.com/ProTruckLogisticsFiles/logo.jpg"
-            }
-        },
-        "datePublished": format_iso_date(post["date"]),
-        "dateModified": format_iso_date(post["date"]),
-        "mainEntityOfPage": {
-            "@type": "WebPage",
-            "@id": f"https://www.protrucklogistics.com/blog-posts/post-{post_id}.html"
-        }
-    }
-    
-    # Enhanced Schema.org generation
+    # Schema.org generation
     def format_iso_date(date_string):
         """Convert a date string like 'March 29, 2025' to ISO 8601 format."""
         try:
@@ -858,13 +1203,6 @@ def create_blog_post_html(post):
     # Convert to JSON string with proper indentation
     schema_json = json.dumps(schema_data, indent=2)
 
-    # Replace the placeholder schema with enhanced data
-    template = re.sub(
-        r'<script type="application/ld\+json" id="article-schema">\s*\{.*?\}\s*</script>',
-        f'<script type="application/ld\+json" id="article-schema">\n{schema_json}\n</script>',
-        template, 
-        flags=re.DOTALL
-    )
     # Get the correct image path 
     image_path = post["image"]
     
@@ -873,85 +1211,81 @@ def create_blog_post_html(post):
         # From blog post directory, we need to go up one level
         image_path = ".." + image_path[len("blog-posts"):]
     
-    # Replace placeholders with actual content
-    template = template.replace('<title id="post-title">Blog Post | Pro Truck Logistics</title>', 
-                              f'<title>{post["title"]} | Pro Truck Logistics</title>')
-    
-    template = template.replace('<meta id="meta-description" name="description" content="Logistics and transportation industry insights from Pro Truck Logistics">', 
-                              f'<meta name="description" content="{post["meta"]["description"]}">')
-    
-    template = template.replace('<meta id="meta-keywords" name="keywords" content="logistics, trucking, transportation">', 
-                              f'<meta name="keywords" content="{post["meta"]["keywords"]}">')
-    
-    template = template.replace('<meta id="og-title" property="og:title" content="Blog Post | Pro Truck Logistics">', 
-                              f'<meta property="og:title" content="{post["title"]} | Pro Truck Logistics">')
-    
-    template = template.replace('<meta id="og-description" property="og:description" content="Logistics and transportation industry insights from Pro Truck Logistics">', 
-                              f'<meta property="og:description" content="{post["meta"]["description"]}">')
-    
-    template = template.replace('<meta id="og-image" property="og:image" content="">', 
-                              f'<meta property="og:image" content="{post["image"]}">')
-    
-    template = template.replace('background-image: linear-gradient(rgba(0, 0, 0, 0.5), rgba(0, 0, 0, 0.5)), url(\'\');', 
-                              f'background-image: linear-gradient(rgba(0, 0, 0, 0.5), rgba(0, 0, 0, 0.5)), url(\'{image_path}\');')
-    
-    if '<header id="post-header" class="page-header">' in template:
-        template = template.replace('<header id="post-header" class="page-header">', 
-                                  f'<header id="post-header" class="page-header" style="background-image: linear-gradient(rgba(0, 0, 0, 0.5), rgba(0, 0, 0, 0.5)), url(\'{image_path}\');">')
-    
-    template = template.replace('<span id="post-category" class="post-category">Category</span>', 
-                              f'<span id="post-category" class="post-category">{post["category"]}</span>')
-    
-    template = template.replace('<h1 id="post-title-header" class="post-title">Blog Post Title</h1>', 
-                              f'<h1 id="post-title-header" class="post-title">{post["title"]}</h1>')
-    
-    template = template.replace('<span id="post-date">Date</span>', 
-                              f'<span id="post-date">{post["date"]}</span>')
-    
-    template = template.replace('<span id="post-author">Author</span>', 
-                              f'<span id="post-author">{post["author"]}</span>')
-    
-    template = template.replace('<span id="post-read-time">Read time</span>', 
-                              f'<span id="post-read-time">{post["read_time"]}</span>')
-    
-    template = template.replace('<div id="post-content">\n          <!-- Content will be dynamically inserted here -->\n        </div>', 
-                              f'<div id="post-content">\n          {post["content"]}\n        </div>')
-    
-    template = template.replace('<img id="author-image" src="" alt="Author">', 
-                              f'<img id="author-image" src="{post["author_image"]}" alt="{post["author"]}">')
-    
-    template = template.replace('<h4 id="author-name" class="author-name">Author Name</h4>', 
-                              f'<h4 id="author-name" class="author-name">{post["author"]}</h4>')
-    
-    template = template.replace('<p id="author-position" class="author-position">Position</p>', 
-                              f'<p id="author-position" class="author-position">{post["author_position"]}</p>')
-    
-    template = template.replace('<p id="author-bio">Author bio will be displayed here.</p>', 
-                              f'<p id="author-bio">{post["author_bio"]}</p>')
-    
-    # Update share buttons with the post URL
+    # Share buttons point at the published post URL
     share_url = f"https://protrucklogistics.org/blog-posts/post-{post_id}.html"  # Update with your actual domain
+    share_title = quote(post["title"])
+    share_links = {
+        f"share_{network}": link.format(url=share_url, title=share_title)
+        for network, link in SHARE_LINKS.items()
+    }
     
-    template = template.replace('<a href="#" class="share-button facebook">', 
-                              f'<a href="https://www.facebook.com/sharer/sharer.php?u={share_url}" target="_blank" class="share-button facebook">')
-    
-    template = template.replace('<a href="#" class="share-button twitter">', 
-                              f'<a href="https://twitter.com/intent/tweet?url={share_url}&text={post["title"]}" target="_blank" class="share-button twitter">')
-    
-    template = template.replace('<a href="#" class="share-button linkedin">', 
-                              f'<a href="https://www.linkedin.com/shareArticle?mini=true&url={share_url}&title={post["title"]}" target="_blank" class="share-button linkedin">')
-    
-    template = template.replace('<a href="#" class="share-button email">', 
-                              f'<a href="mailto:?subject={post["title"]}&body=Check out this article: {share_url}" class="share-button email">')
+    # Fill every ${placeholder} in the template in a single pass. The page's own
+    # JavaScript template literals are escaped as $${...} in the template, so a
+    # missing value raises here instead of leaving a placeholder in the page.
+    template = _load_template().substitute(
+        post_title=post["title"],
+        meta_description=post["meta"]["description"],
+        meta_keywords=post["meta"]["keywords"],
+        og_image=post["image"],
+        header_image=image_path,
+        post_category=post["category"],
+        post_date=post["date"],
+        post_author=post["author"],
+        post_read_time=post["read_time"],
+        post_content=post["content"],
+        author_image=post["author_image"],
+        author_position=post["author_position"],
+        author_bio=post["author_bio"],
+        schema_json=schema_json,
+        **share_links,
+    )
 
     # Save the HTML file
     html_filepath = LOCAL_BLOG_DIR / html_filename
-    with open(html_filepath, "w", encoding="utf-8") as f:
-        f.write(template)
+    write_local_file(html_filepath, template.encode("utf-8"))
     
     print(f"Created HTML file: {html_filepath}")
     return html_filepath
 
+def save_post_files(post):
+    """
+    Writes a finished post's JSON and HTML files and returns every local file
+    belonging to it, including the downloaded image.
+    """
+    # Save the post data as JSON
+    files = [save_blog_post(post)]
+    
+    # Create HTML file for the post
+    files.append(create_blog_post_html(post))
+    
+    # Include the downloaded image unless the post fell back to a remote one
+    if not post["image"].startswith("http"):
+        files.append(LOCAL_BLOG_DIR / post["image"])
+    
+    # Remember the post until the index includes it
+    PENDING_POSTS_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(PENDING_POSTS_FILE, "a", encoding="utf-8") as pending:
+        pending.write(f"{post['id']}\n")
+    
+    print(f"Completed blog post: {post['title']}")
+    return files
+
+def load_pending_posts():
+    """
+    Loads the posts an interrupted run saved but never added to the index.
+    """
+    if not PENDING_POSTS_FILE.exists():
+        return []
+    
+    posts = []
+    for post_id in dict.fromkeys(PENDING_POSTS_FILE.read_text(encoding="utf-8").split()):
+        post_path = LOCAL_BLOG_DIR / f"{post_id}.json"
+        try:
+            posts.append(load_json_bytes(post_path.read_bytes()))
+        except (OSError, ValueError) as e:
+            print(f"Could not resume post {post_id}: {e}")
+    return posts
+
 def update_blog_index(posts):
     """
     Updates the blog index JSON file with all blog posts.
@@ -961,15 +1295,16 @@ def update_blog_index(posts):
     
     # Read existing index if it exists
     if index_path.exists():
-        with open(index_path, "r", encoding="utf-8") as f:
-            try:
-                all_posts = json.load(f)
-            except json.JSONDecodeError:
-                all_posts = []
+        try:
+            all_posts = load_json_bytes(index_path.read_bytes())
+        except json.JSONDecodeError:
+            all_posts = []
     else:
         all_posts = []
     
     # Add new posts to the index
+    existing_ids = {p["id"] for p in all_posts}
+    new_items = []
     for post in posts:
         # Create a simplified version for the index
         index_post = {
@@ -986,8 +1321,9 @@ def update_blog_index(posts):
         }
         
         # Add to index, avoiding duplicates
-        if not any(p["id"] == post["id"] for p in all_posts):
-            all_posts.append(index_post)
+        if post["id"] not in existing_ids:
+            existing_ids.add(post["id"])
+            new_items.append(index_post)
     
     # Handle sorting with mixed string/integer IDs
     def get_sort_key(post):
@@ -1000,45 +1336,55 @@ def update_blog_index(posts):
                 return post_id  # Keep as string if conversion fails
         return post_id  # Return as-is if not a "bp" format
 
-    # Sort posts with the custom sorting function
-    all_posts.sort(key=get_sort_key, reverse=True)
+    # The saved index is already sorted, so only the new posts need sorting
+    # before they are merged in
+    new_items.sort(key=get_sort_key, reverse=True)
+    all_posts = list(heapq.merge(new_items, all_posts, key=get_sort_key, reverse=True))
+    
+    # Save updated index, kept indented since it is committed to the repository
+    write_local_file(index_path, dump_json_bytes(all_posts))
     
-    # Save updated index
-    with open(index_path, "w", encoding="utf-8") as f:
-        json.dump(all_posts, f, ensure_ascii=False, indent=2)
+    # Save a compact gzip-compressed copy for the blog listing page to fetch
+    write_local_file(LOCAL_BLOG_DIR / "index.json.gz", gzip.compress(dump_json_bytes(all_posts, compact=True), compresslevel=9))
     
     print(f"Updated blog index with {len(posts)} new posts")
     return index_path
 
-def upload_files_to_server():
+def upload_files_to_server(files):
     """
-    Uploads all files in the blog-posts directory to the server.
+    Uploads the given files from the blog-posts directory to the server.
     Handles both FTP and SFTP connections.
     """
     print(f"Uploading files to server {FTP_HOST}...")
     
     if FTP_IS_SFTP:
-        return upload_files_via_sftp()
+        return upload_files_via_sftp(files)
     else:
-        return upload_files_via_ftp()
+        return upload_files_via_ftp(files)
 
-def upload_files_via_sftp():
+def upload_files_via_sftp(files):
     """
     Uploads files using SFTP protocol.
     """
+    # Imported here since paramiko is slow to load and only needed for SFTP uploads
+    import paramiko
+    
     try:
         # Create an SSH client
         ssh = paramiko.SSHClient()
         ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
         
         print(f"Connecting to SFTP server {FTP_HOST}...")
-        ssh.connect(hostname=FTP_HOST, username=FTP_USER, password=FTP_PASS)
+        # HTML and JSON compress very well, so let SSH compress the channel
+        ssh.connect(hostname=FTP_HOST, username=FTP_USER, password=FTP_PASS, compress=True)
         sftp = ssh.open_sftp()
         
-        # Check if blog directory exists, create if needed
+        # List the blog directory once; the listing answers both whether it and
+        # the images directory exist and which files are already up to date
         try:
-            sftp.stat(FTP_BLOG_DIR)
+            blog_listing = {attr.filename: attr for attr in sftp.listdir_attr(FTP_BLOG_DIR)}
         except FileNotFoundError:
+            blog_listing = {}
             print(f"Creating directory {FTP_BLOG_DIR}")
             # Create the directory and any parent directories
             path_parts = FTP_BLOG_DIR.strip('/').split('/')
@@ -1052,31 +1398,63 @@ def upload_files_via_sftp():
         
         # Check if images directory exists, create if needed
         images_remote_path = f"{FTP_BLOG_DIR}/images"
-        try:
-            sftp.stat(images_remote_path)
-        except FileNotFoundError:
+        if "images" in blog_listing:
+            images_listing = {attr.filename: attr for attr in sftp.listdir_attr(images_remote_path)}
+        else:
             print(f"Creating directory {images_remote_path}")
             sftp.mkdir(images_remote_path)
+            images_listing = {}
         
-        # Get all files in the blog directory
-        all_files = list(LOCAL_BLOG_DIR.glob("*.json")) + list(LOCAL_BLOG_DIR.glob("*.html"))
-        
-        # Get all files in the images subdirectory
-        image_files = list(IMAGES_DIR.glob("*.*"))
-        
-        # Upload regular blog files
-        for file_path in all_files:
-            remote_path = f"{FTP_BLOG_DIR}/{file_path.name}"
+        def put_file(client, file_path, remote_path):
+            # Files written by this run are sent straight from memory. The size
+            # check after each write costs an extra STAT round trip per file, and
+            # a failed write already raises, so it is skipped.
             print(f"Uploading {file_path.name} to {remote_path}...")
-            sftp.put(str(file_path), remote_path)
+            payload = _written_files.get(file_path)
+            if payload is not None:
+                client.putfo(BytesIO(payload), remote_path, file_size=len(payload), confirm=False)
+            else:
+                client.put(str(file_path), remote_path, confirm=False)
             print(f"Successfully uploaded {file_path.name}")
         
-        # Upload image files
-        for file_path in image_files:
-            remote_path = f"{images_remote_path}/{file_path.name}"
-            print(f"Uploading image {file_path.name} to {remote_path}...")
-            sftp.put(str(file_path), remote_path)
-            print(f"Successfully uploaded image {file_path.name}")
+        def put_batch(client, batch):
+            for file_path, remote_path in batch:
+                put_file(client, file_path, remote_path)
+        
+        def put_batch_on_new_channel(batch):
+            # Extra channels share the already authenticated SSH transport
+            with paramiko.SFTPClient.from_transport(ssh.get_transport()) as client:
+                put_batch(client, batch)
+        
+        # Pair blog files and images with their remote paths
+        uploads = []
+        for file_path in files:
+            if file_path.parent == LOCAL_BLOG_DIR:
+                remote_dir, listing = FTP_BLOG_DIR, blog_listing
+            elif file_path.parent == IMAGES_DIR:
+                remote_dir, listing = images_remote_path, images_listing
+            else:
+                continue
+            
+            # Same size and uploaded after the last local change means nothing to send
+            local_stat = file_path.stat()
+            remote = listing.get(file_path.name)
+            if remote and remote.st_size == local_stat.st_size and remote.st_mtime >= int(local_stat.st_mtime):
+                print(f"Skipping {file_path.name}, already up to date on the server")
+                continue
+            uploads.append((file_path, f"{remote_dir}/{file_path.name}"))
+        
+        # Spread the files across a few SFTP channels that upload in parallel
+        batches = [uploads[i::FTP_UPLOAD_WORKERS] for i in range(FTP_UPLOAD_WORKERS)]
+        batches = [batch for batch in batches if batch]
+        if batches:
+            with ThreadPoolExecutor(max_workers=len(batches)) as executor:
+                # The channel opened above takes the first batch
+                futures = [executor.submit(put_batch, sftp, batches[0])]
+                futures += [executor.submit(put_batch_on_new_channel, batch) for batch in batches[1:]]
+                # Wait on every result so any worker exception is raised here
+                for future in futures:
+                    future.result()
         
         # Close connections
         sftp.close()
@@ -1088,71 +1466,184 @@ def upload_files_via_sftp():
         print(f"Error uploading files via SFTP: {e}")
         return False
 
-def upload_files_via_ftp():
+# Control connection kept open for reuse across uploads in the same process
+_ftp_connection = None
+
+def connect_ftp():
+    """
+    Opens an authenticated FTP connection.
+    Uses FTPS with an encrypted data channel when FTP_USE_TLS is enabled.
+    """
+    if FTP_USE_TLS:
+        ftp = ftplib.FTP_TLS(FTP_HOST)
+        ftp.login(FTP_USER, FTP_PASS)
+        ftp.prot_p()
+    else:
+        ftp = ftplib.FTP(FTP_HOST, FTP_USER, FTP_PASS)
+    
+    # Passive mode lets the data connection open outbound, which works from
+    # CI runners behind NAT
+    ftp.set_pasv(True)
+    return ftp
+
+def get_ftp_connection():
+    """
+    Returns the shared FTP connection, reconnecting if it has dropped.
+    """
+    global _ftp_connection
+    
+    if _ftp_connection is not None:
+        try:
+            _ftp_connection.voidcmd("NOOP")
+            return _ftp_connection
+        except ftplib.all_errors:
+            _ftp_connection = None
+    
+    _ftp_connection = connect_ftp()
+    return _ftp_connection
+
+@atexit.register
+def close_ftp_connection():
+    """
+    Closes the shared FTP connection if one is open.
+    """
+    global _ftp_connection
+    
+    if _ftp_connection is not None:
+        try:
+            _ftp_connection.quit()
+        except ftplib.all_errors:
+            _ftp_connection.close()
+        _ftp_connection = None
+
+def list_remote_files_via_ftp(ftp, remote_dir):
+    """
+    Lists a remote directory with a single MLSD command.
+    Returns a dictionary of file name -> (size, modified timestamp).
+    Returns an empty dictionary if the listing fails for any reason, including a
+    temporary reply or a TLS/socket error on the data connection.
+    """
+    try:
+        entries = ftp.mlsd(remote_dir, facts=["type", "size", "modify"])
+        remote_files = {}
+        for name, facts in entries:
+            if facts.get("type") != "file" or "size" not in facts or "modify" not in facts:
+                continue
+            modified = datetime.strptime(facts["modify"][:14], "%Y%m%d%H%M%S").replace(tzinfo=timezone.utc)
+            remote_files[name] = (int(facts["size"]), modified.timestamp())
+        return remote_files
+    except ftplib.all_errors as e:
+        print(f"Could not list {remote_dir}, uploading everything: {e}")
+        return {}
+
+def upload_one_via_ftp(ftp, file_path):
+    """
+    Uploads a single file into the FTP connection's current directory.
+    """
+    file_name = file_path.name
+    print(f"Uploading {file_name}...")
+    
+    payload = _written_files.get(file_path)
+    if payload is not None:
+        # Written by this run, so the bytes are still in memory
+        ftp.storbinary(f'STOR {file_name}', BytesIO(payload), blocksize=FTP_BLOCKSIZE)
+    else:
+        with open(file_path, 'rb') as file:
+            if file_path.stat().st_size < FTP_SMALL_FILE_SIZE:
+                # Small files go up from memory in a single block
+                ftp.storbinary(f'STOR {file_name}', BytesIO(file.read()), blocksize=FTP_BLOCKSIZE)
+            else:
+                ftp.storbinary(f'STOR {file_name}', file, blocksize=FTP_BLOCKSIZE)
+    
+    print(f"Successfully uploaded {file_name}")
+
+def upload_batch_via_ftp(ftp, batch):
+    """
+    Uploads a batch of (file_path, remote_dir) pairs over the given FTP connection,
+    only changing directory when the batch moves to a different one.
+    """
+    current_dir = None
+    for file_path, remote_dir in batch:
+        if remote_dir != current_dir:
+            ftp.cwd(remote_dir)
+            current_dir = remote_dir
+        upload_one_via_ftp(ftp, file_path)
+
+def upload_batch_via_new_ftp_connection(batch):
+    """
+    Uploads a batch of (file_path, remote_dir) pairs over a connection of its own.
+    """
+    with connect_ftp() as ftp:
+        upload_batch_via_ftp(ftp, batch)
+
+def upload_files_via_ftp(files):
     """
     Uploads files using traditional FTP protocol.
     """
     try:
-        import ftplib
-        
         print(f"Connecting to FTP server {FTP_HOST}...")
-        with ftplib.FTP(FTP_HOST, FTP_USER, FTP_PASS) as ftp:
-            print("Connected to FTP server")
-            
-            # Try to change to the blog directory
-            try:
-                ftp.cwd(FTP_BLOG_DIR)
-            except ftplib.error_perm:
-                # If directory doesn't exist, create it
-                print(f"Creating directory {FTP_BLOG_DIR}")
-                # Split the path and create each directory level
-                path_parts = FTP_BLOG_DIR.strip('/').split('/')
-                for i in range(len(path_parts)):
-                    try:
-                        ftp.cwd('/' + '/'.join(path_parts[:i+1]))
-                    except ftplib.error_perm:
-                        ftp.mkd('/' + '/'.join(path_parts[:i+1]))
-                        ftp.cwd('/' + '/'.join(path_parts[:i+1]))
-            
-            # Create images directory if it doesn't exist
-            try:
-                ftp.cwd('images')
-                ftp.cwd('..')  # Go back to parent directory
-            except ftplib.error_perm:
+        ftp = get_ftp_connection()
+        print("Connected to FTP server")
+        
+        # Try to change to the blog directory
+        try:
+            ftp.cwd(FTP_BLOG_DIR)
+        except ftplib.error_perm:
+            # If directory doesn't exist, create it
+            print(f"Creating directory {FTP_BLOG_DIR}")
+            # Split the path and create each directory level
+            path_parts = FTP_BLOG_DIR.strip('/').split('/')
+            for i in range(len(path_parts)):
                 try:
-                    ftp.mkd('images')
-                    print("Created 'images' directory on FTP server")
-                except ftplib.error_perm as e:
-                    print(f"Error creating images directory: {e}")
-            
-            # Get all files in the blog directory
-            all_files = list(LOCAL_BLOG_DIR.glob("*.json")) + list(LOCAL_BLOG_DIR.glob("*.html"))
-            
-            # Get all files in the images subdirectory
-            image_files = list(IMAGES_DIR.glob("*.*"))
-            
-            # Upload regular blog files
-            for file_path in all_files:
-                file_name = file_path.name
-                print(f"Uploading {file_name}...")
-                
-                with open(file_path, 'rb') as file:
-                    ftp.storbinary(f'STOR {file_name}', file)
-                
-                print(f"Successfully uploaded {file_name}")
+                    ftp.cwd('/' + '/'.join(path_parts[:i+1]))
+                except ftplib.error_perm:
+                    ftp.mkd('/' + '/'.join(path_parts[:i+1]))
+                    ftp.cwd('/' + '/'.join(path_parts[:i+1]))
+        
+        # Create images directory if it doesn't exist
+        try:
+            ftp.cwd('images')
+            ftp.cwd('..')  # Go back to parent directory
+        except ftplib.error_perm:
+            try:
+                ftp.mkd('images')
+                print("Created 'images' directory on FTP server")
+            except ftplib.error_perm as e:
+                print(f"Error creating images directory: {e}")
+        
+        # List each remote directory once to find files that are already up to date
+        remote_images_dir = posixpath.join(FTP_BLOG_DIR, "images")
+        remote_listings = {
+            FTP_BLOG_DIR: list_remote_files_via_ftp(ftp, FTP_BLOG_DIR),
+            remote_images_dir: list_remote_files_via_ftp(ftp, remote_images_dir)
+        }
+        
+        # Pair each file with the remote directory it belongs in
+        uploads = []
+        for p in files:
+            remote_dir = remote_images_dir if p.parent == IMAGES_DIR else FTP_BLOG_DIR
+            local_stat = p.stat()
+            remote = remote_listings[remote_dir].get(p.name)
             
-            # Upload image files
-            if image_files:
-                ftp.cwd('images')
-                for file_path in image_files:
-                    file_name = file_path.name
-                    print(f"Uploading image {file_name}...")
-                    
-                    with open(file_path, 'rb') as file:
-                        ftp.storbinary(f'STOR {file_name}', file)
-                    
-                    print(f"Successfully uploaded image {file_name}")
-                ftp.cwd('..')  # Go back to parent directory
+            # Same size and uploaded after the last local change means nothing to send
+            # (MLSD timestamps only have whole-second precision)
+            if remote and remote[0] == local_stat.st_size and remote[1] >= int(local_stat.st_mtime):
+                print(f"Skipping {p.name}, already up to date on the server")
+                continue
+            uploads.append((p, remote_dir))
+        
+        # Spread the files across a few connections that upload in parallel
+        batches = [uploads[i::FTP_UPLOAD_WORKERS] for i in range(FTP_UPLOAD_WORKERS)]
+        batches = [batch for batch in batches if batch]
+        if batches:
+            with ThreadPoolExecutor(max_workers=len(batches)) as executor:
+                # The already logged-in shared connection takes the first batch,
+                # so only the extra workers pay for a new handshake
+                futures = [executor.submit(upload_batch_via_ftp, ftp, batches[0])]
+                futures += [executor.submit(upload_batch_via_new_ftp_connection, batch) for batch in batches[1:]]
+                # Wait on every result so any worker exception is raised here
+                for future in futures:
+                    future.result()
         
         print("All files uploaded successfully via FTP")
         return True
@@ -1160,70 +1651,140 @@ def upload_files_via_ftp():
         print(f"Error uploading files via FTP: {e}")
         return False
     
-def upload_blog_files():
+def iter_files_changed_since(cutoff):
+    """
+    Yields the post, index and image files modified after the given timestamp.
+    Each directory is scanned once, reusing the stat results scandir already has.
+    """
+    for directory, suffixes in ((LOCAL_BLOG_DIR, (".json", ".html")), (IMAGES_DIR, None)):
+        if not directory.is_dir():
+            continue
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.startswith(".") or not entry.is_file():
+                    continue
+                if suffixes and not entry.name.endswith(suffixes):
+                    continue
+                if entry.stat().st_mtime > cutoff:
+                    yield directory / entry.name
+
+def upload_blog_files(new_files):
     """
-    Upload all local blog files to the FTP server.
+    Upload the files written by this run, plus the index and its gzip copy.
+    Anything changed since the last successful upload is retried as well.
     """
-    # Get all files in the blog directory
-    all_files = list(LOCAL_BLOG_DIR.glob("*.*"))
+    files_to_upload = dict.fromkeys(new_files)
+    files_to_upload.update(dict.fromkeys([LOCAL_BLOG_DIR / "index.json", LOCAL_BLOG_DIR / "index.json.gz"]))
     
-    # Get all files in the images subdirectory
-    image_files = list((LOCAL_BLOG_DIR / "images").glob("*.*"))
+    # Pick up files from an earlier run whose upload didn't go through
+    if LAST_UPLOAD_STATE.exists():
+        files_to_upload.update(dict.fromkeys(iter_files_changed_since(LAST_UPLOAD_STATE.stat().st_mtime)))
     
-    # Combine both lists
-    all_files.extend(image_files)
+    print(f"Found {len(files_to_upload)} files to upload")
+    upload_success = upload_files_to_server(list(files_to_upload))
     
-    if not all_files:
-        print("No files to upload")
-        return False
+    # Only advance the marker once the server has everything
+    if upload_success:
+        LAST_UPLOAD_STATE.touch()
     
-    print(f"Found {len(all_files)} files to upload")
-    return upload_files_to_ftp(all_files)
+    return upload_success
 
-def main():
+async def main():
     """
     Main function to run the blog generation and upload process.
     """
     print("Starting blog post generation...")
+    start_time = time.perf_counter()
     
-    # Fetch current logistics topics using improved methods
-    print("Fetching current logistics topics...")
-    topics = get_current_logistics_topics()
-    
-    # Select random topics for this run
-    if len(topics) > POSTS_TO_GENERATE:
-        selected_topics = random.sample(topics, POSTS_TO_GENERATE)
-    else:
-        selected_topics = topics
-    
-    print(f"Selected {len(selected_topics)} topics for blog generation")
-    
-    # Generate and save blog posts
-    generated_posts = []
-    for topic in selected_topics:
-        # Generate the blog post with all components
-        print(f"\nGenerating blog post for: {topic['title']}")
-        post = generate_blog_post(topic)
+    try:
+        # Fetch current logistics topics using improved methods
+        print("Fetching current logistics topics...")
+        topics = await get_cached_logistics_topics()
         
-        # Save the post data as JSON
-        save_blog_post(post)
+        # Posts an interrupted run already saved count toward this run
+        pending_posts = load_pending_posts()
+        if pending_posts:
+            print(f"Resuming {len(pending_posts)} posts saved by an interrupted run")
+        done_titles = {post["title"].strip().lower() for post in pending_posts}
         
-        # Create HTML file for the post
-        create_blog_post_html(post)
+        # Drop repeated headlines so two posts are never generated from the same story
+        unique_topics = {}
+        for topic in topics:
+            title_key = topic["title"].strip().lower()
+            if title_key not in done_titles:
+                unique_topics.setdefault(title_key, topic)
+        topics = list(unique_topics.values())
         
-        generated_posts.append(post)
-        print(f"Completed blog post: {post['title']}")
-    
-    # Update the blog index
-    update_blog_index(generated_posts)
-    
-    # Upload files to FTP
-    upload_success = upload_files_to_server()
-    
-    if upload_success:
-        print("Blog post generation and upload completed successfully")
-    else:
-        print("Blog post generation completed but there was an error with the upload")
+        # Select random topics for this run
+        posts_needed = max(0, POSTS_TO_GENERATE - len(pending_posts))
+        selected_topics = random.sample(topics, min(len(topics), posts_needed))
+        
+        print(f"Selected {len(selected_topics)} topics for blog generation")
+        
+        # Reserve IDs up front so every post in this run gets a unique one
+        post_ids = allocate_post_ids(len(selected_topics))
+        
+        # Every file written for this run's posts, for the upload
+        new_files = []
+        for post in pending_posts:
+            new_files.extend(save_post_files(post))
+        
+        # Generate the blog posts with all components, all topics at once
+        if not selected_topics:
+            # Resumed posts already cover this run
+            posts = []
+        elif BATCH_MODE:
+            posts = await generate_blog_posts_batch(selected_topics, post_ids)
+            for post in posts:
+                new_files.extend(save_post_files(post))
+        else:
+            # Cap how many posts are in flight so large runs stay under the API rate limits
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_POSTS)
+            
+            async def generate_with_limit(topic, post_id):
+                async with semaphore:
+                    post = await generate_blog_post(topic, post_id)
+                # Save each post as soon as it is ready instead of waiting for the slowest one,
+                # off the event loop so rendering and disk writes don't stall other posts
+                new_files.extend(await asyncio.to_thread(save_post_files, post))
+                return post
+            
+            results = await asyncio.gather(*(
+                generate_with_limit(topic, post_id)
+                for topic, post_id in zip(selected_topics, post_ids)
+            ), return_exceptions=True)
+            
+            # A failed post is skipped so the rest of the run is still published
+            posts = []
+            for topic, result in zip(selected_topics, results):
+                if isinstance(result, BaseException):
+                    print(f"Error generating blog post about {topic['title']}: {result}")
+                else:
+                    posts.append(result)
+        
+        # Update the blog index, after which no post is pending any more
+        update_blog_index(pending_posts + posts)
+        PENDING_POSTS_FILE.unlink(missing_ok=True)
+        
+        # Upload this run's files and the refreshed index to the server
+        upload_success = upload_blog_files(new_files)
+        
+        if upload_success:
+            print("Blog post generation and upload completed successfully")
+        else:
+            print("Blog post generation completed but there was an error with the upload")
+        
+        # One machine-readable line so monitoring can track runs without parsing the log
+        print("##SUMMARY## " + json.dumps({
+            "duration_s": round(time.perf_counter() - start_time, 1),
+            "posts_generated": len(posts),
+            "posts_resumed": len(pending_posts),
+            "files_written": len(new_files),
+            "upload_ok": upload_success
+        }))
+    finally:
+        # Release the pooled HTTP connections behind the async OpenAI client
+        await async_client.close()
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())